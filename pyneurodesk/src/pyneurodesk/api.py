@@ -58,6 +58,7 @@ WATCHDOG_TIMEOUT_SECONDS = 30.0
 WATCHDOG_FEED_INTERVAL_SECONDS = 10.0
 _WATCHDOG_THREADS: dict[str, tuple[threading.Event, threading.Thread]] = {}
 _WATCHDOG_THREADS_LOCK = threading.Lock()
+SHELL_ENV_REFERENCE_RE = re.compile(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?")
 
 
 class ProgressReporter(Protocol):
@@ -198,6 +199,7 @@ class NeurodeskContainer:
         self._owned_daemon = owned_daemon
         self._closed = False
         self._deploy_metadata: Optional[DeployMetadata] = None
+        self._runtime_env: Optional[tuple[str, ...]] = None
 
     @property
     def name(self) -> str:
@@ -233,13 +235,19 @@ class NeurodeskContainer:
     def deploy_env(self) -> tuple[str, ...]:
         return self.deploy_metadata.deploy_env
 
+    @property
+    def runtime_env(self) -> tuple[str, ...]:
+        if self._runtime_env is None:
+            self._runtime_env = runtime_deploy_env_entries(self.deploy_env)
+        return self._runtime_env
+
     def run(self, *args: object) -> str:
         if self._closed:
             raise RuntimeError("container handle is closed")
         command, shares = self._resolve_command(args)
         if not command:
             raise ValueError("at least one command argument is required")
-        deploy_env = runtime_deploy_env_entries(self.deploy_env)
+        deploy_env = self.runtime_env
         try:
             result = self._run_command(command, shares=shares, env=deploy_env)
         except httpx.ConnectError as exc:
@@ -644,8 +652,9 @@ def load_deploy_metadata(container_handle: NeurodeskContainer) -> DeployMetadata
         entries = container_handle._client.cvmfs_list(source)
     except (AttributeError, httpx.HTTPError):
         return DeployMetadata()
+    listed_names = {entry.name for entry in entries.entries}
     entry_names = {entry.name for entry in entries.entries if entry.kind == "file"}
-    commands_text = read_cvmfs_text(container_handle, f"{directory}/commands.txt", allow_missing=True)
+    commands_text = read_listed_cvmfs_text(container_handle, directory, "commands.txt", listed_names)
     commands = tuple(
         sorted(
             {
@@ -655,7 +664,7 @@ def load_deploy_metadata(container_handle: NeurodeskContainer) -> DeployMetadata
             }
         )
     )
-    deploy_env_text = read_cvmfs_text(container_handle, f"{directory}/env.txt", allow_missing=True)
+    deploy_env_text = read_listed_cvmfs_text(container_handle, directory, "env.txt", listed_names)
     deploy_env = [
         line
         for line in (
@@ -666,7 +675,9 @@ def load_deploy_metadata(container_handle: NeurodeskContainer) -> DeployMetadata
         if line is not None
     ]
     image_env = load_image_metadata_env(container_handle)
-    build_commands, build_env = load_build_deploy_metadata(container_handle, directory, image_env)
+    build_commands, build_env = load_build_deploy_metadata(
+        container_handle, directory, image_env, listed_names=listed_names
+    )
     commands = tuple(sorted({*commands, *build_commands}))
     return DeployMetadata(commands=commands, deploy_env=merge_env_entries([*image_env, *build_env, *deploy_env]))
 
@@ -697,8 +708,10 @@ def load_build_deploy_metadata(
     container_handle: NeurodeskContainer,
     directory: str,
     image_env: tuple[str, ...],
+    *,
+    listed_names: Optional[set[str]] = None,
 ) -> tuple[tuple[str, ...], tuple[str, ...]]:
-    text = read_cvmfs_text(container_handle, f"{directory.rstrip('/')}/build.yaml", allow_missing=True)
+    text = read_listed_cvmfs_text(container_handle, directory, "build.yaml", listed_names)
     deploy_path, deploy_bins = parse_top_level_deploy(text)
     env: list[str] = []
     if deploy_path and env_value(image_env, "DEPLOY_PATH") == "":
@@ -811,7 +824,7 @@ def expand_shell_env_references(value: str, env: tuple[str, ...] | list[str]) ->
             return env_value(env, name) or "/usr/local/sbin:/usr/local/bin:/usr/sbin:/usr/bin:/sbin:/bin"
         return env_value(env, name)
 
-    return re.sub(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?", replace, value)
+    return SHELL_ENV_REFERENCE_RE.sub(replace, value)
 
 
 def prepend_path_env(env: tuple[str, ...], deploy_path: tuple[str, ...]) -> str:
@@ -878,6 +891,17 @@ def read_cvmfs_text(
     return decode_cvmfs_text(response.data)
 
 
+def read_listed_cvmfs_text(
+    container_handle: NeurodeskContainer,
+    directory: str,
+    name: str,
+    listed_names: Optional[set[str]],
+) -> str:
+    if listed_names is not None and name not in listed_names:
+        return ""
+    return read_cvmfs_text(container_handle, f"{directory.rstrip('/')}/{name}", allow_missing=True)
+
+
 def decode_cvmfs_text(raw: bytes) -> str:
     text = raw.decode("utf-8", errors="replace")
     stripped = "".join(text.split())
@@ -31,6 +31,10 @@ from .models import (
 
 DEFAULT_BOOT_TIMEOUT_SECONDS = 5.0
 
+_STREAM_PARAMS = {"stream": "1"}
+_NDJSON_HEADERS = {"Accept": "application/x-ndjson"}
+_IMPORT_STREAM_TIMEOUT = httpx.Timeout(connect=10.0, read=None, write=300.0, pool=10.0)
+
 
 class PyNeurodeskClient:
     def __init__(
@@ -67,17 +71,13 @@ class PyNeurodeskClient:
         *,
         timeout: Optional[Union[float, httpx.Timeout]] = None,
     ) -> Iterable[DownloadProgress]:
-        stream_timeout = (
-            timeout
-            if timeout is not None
-            else httpx.Timeout(connect=10.0, read=None, write=300.0, pool=10.0)
-        )
+        stream_timeout = timeout if timeout is not None else _IMPORT_STREAM_TIMEOUT
         with self._client.stream(
             "POST",
             f"/image/{name}",
-            params={"stream": "1"},
+            params=_STREAM_PARAMS,
             json=request.to_payload(),
-            headers={"Accept": "application/x-ndjson"},
+            headers=_NDJSON_HEADERS,
             timeout=stream_timeout,
         ) as response:
             response.raise_for_status()
@@ -158,9 +158,9 @@ class PyNeurodeskClient:
         with self._client.stream(
             "POST",
             "/kernel/download",
-            params={"stream": "1"},
+            params=_STREAM_PARAMS,
             json={},
-            headers={"Accept": "application/x-ndjson"},
+            headers=_NDJSON_HEADERS,
         ) as response:
             response.raise_for_status()
             for line in response.iter_lines():
@@ -194,9 +194,9 @@ class PyNeurodeskClient:
         with self._client.stream(
             "POST",
             f"/image/{name}/qemu/download",
-            params={"stream": "1"},
+            params=_STREAM_PARAMS,
             json={},
-            headers={"Accept": "application/x-ndjson"},
+            headers=_NDJSON_HEADERS,
         ) as response:
             response.raise_for_status()
             for line in response.iter_lines():
@@ -326,9 +326,9 @@ class PyNeurodeskClient:
         with self._client.stream(
             "POST",
             "/vm/start",
-            params={"stream": "1"},
+            params=_STREAM_PARAMS,
             json=payload,
-            headers={"Accept": "application/x-ndjson"},
+            headers=_NDJSON_HEADERS,
             timeout=resolve_boot_timeout(timeout),
         ) as response:
             response.raise_for_status()
@@ -373,9 +373,9 @@ class PyNeurodeskClient:
         with self._client.stream(
             "POST",
             "/vm",
-            params={"stream": "1"},
+            params=_STREAM_PARAMS,
             json=payload,
-            headers={"Accept": "application/x-ndjson"},
+            headers=_NDJSON_HEADERS,
             timeout=resolve_boot_timeout(timeout),
         ) as response:
             response.raise_for_status()
@@ -571,9 +571,9 @@ class PyNeurodeskClient:
         with self._client.stream(
             "POST",
             "/vm/run",
-            params={"stream": "1"},
+            params=_STREAM_PARAMS,
             json=request.to_payload(),
-            headers={"Accept": "application/x-ndjson"},
+            headers=_NDJSON_HEADERS,
             timeout=timeout,
         ) as response:
             response.raise_for_status()
@@ -33,6 +33,7 @@ FULLTEST_EXTRA_MESSAGE = "pyneurodesk fulltest dependencies are not installed; i
 DEFAULT_FULLTEST_MEMORY_MB = 12288
 DEFAULT_FULLTEST_CPUS = min(os.cpu_count() or 1, 16)
 DEFAULT_MAX_CONSECUTIVE_TIMEOUTS = 3
+TEST_SCRIPT_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
 
 @dataclass(frozen=True)
@@ -429,7 +430,7 @@ def matlab_script_command(
 
 def slugify_test_script_name(suite_name: str, test_index: int, test_name: str) -> str:
     raw = f"{suite_name}-{test_index:03d}-{test_name}".lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", raw).strip("-")
+    slug = TEST_SCRIPT_SLUG_RE.sub("-", raw).strip("-")
     return slug or f"test-{test_index:03d}"
 
 
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
+import json
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+# Models are built per response (DownloadProgress per streamed progress
+# line), so drop the per-instance __dict__ where dataclass supports it.
+_MODEL_OPTIONS: dict[str, bool] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _MODEL_OPTIONS["slots"] = True
 
-@dataclass(frozen=True)
+
+@dataclass(**_MODEL_OPTIONS)
 class CVMFSSource:
     mirror: str
     repo: str
@@ -26,7 +34,7 @@ class CVMFSSource:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class ImageSource:
     type: str
     format: Optional[str] = None
@@ -50,7 +58,7 @@ class ImageSource:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class ImportImageRequest:
     source: ImageSource
     cache_dir: Optional[str] = None
@@ -93,7 +101,7 @@ class ImportImageRequest:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class ImageState:
     name: str
     status: str
@@ -112,7 +120,7 @@ class ImageState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class KernelState:
     status: str
     error: Optional[str] = None
@@ -129,7 +137,7 @@ class KernelState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class DownloadProgress:
     status: str
     artifact: Optional[str] = None
@@ -160,7 +168,7 @@ class DownloadProgress:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class ImageMetadataState:
     name: str
     status: str
@@ -181,7 +189,7 @@ class ImageMetadataState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class EmulatorState:
     status: str
     path: Optional[str] = None
@@ -198,7 +206,7 @@ class EmulatorState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class CVMFSDirectoryEntry:
     name: str
     path: str
@@ -215,7 +223,7 @@ class CVMFSDirectoryEntry:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class CVMFSListResponse:
     entries: tuple[CVMFSDirectoryEntry, ...]
 
@@ -229,7 +237,7 @@ class CVMFSListResponse:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class CVMFSReadRequest:
     mirror: str
     repo: str
@@ -255,7 +263,7 @@ class CVMFSReadRequest:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class CVMFSReadResponse:
     path: str
     offset: int
@@ -277,7 +285,7 @@ class CVMFSReadResponse:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class ContainerReference:
     name: str
     image: str
@@ -291,13 +299,13 @@ class ContainerReference:
         return self.source.path
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class DeployMetadata:
     commands: tuple[str, ...] = ()
     deploy_env: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class ShareMount:
     source: str
     mount: str
@@ -316,7 +324,7 @@ class ShareMount:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class PortForward:
     host_port: int
     guest_port: int
@@ -338,7 +346,7 @@ class PortForward:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class NetworkConfig:
     enabled: bool = False
     allow_internet: bool = False
@@ -358,7 +366,7 @@ class NetworkConfig:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class RunCommandRequest:
     image: str
     command: tuple[str, ...]
@@ -406,7 +414,7 @@ class RunCommandRequest:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class CommandResult:
     exit_code: int
     output: str
@@ -419,7 +427,7 @@ class CommandResult:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class VMState:
     status: str
     id: Optional[str] = None
@@ -444,7 +452,7 @@ class VMState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class VMSupportedState:
     supported: bool
     error: Optional[str] = None
@@ -457,7 +465,7 @@ class VMSupportedState:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(**_MODEL_OPTIONS)
 class DaemonState:
     addr: str
     cache_dir: Optional[str] = None
@@ -469,8 +477,6 @@ class DaemonState:
     @classmethod
     def from_file(cls, path: Path) -> "DaemonState":
         payload = path.read_text()
-        import json
-
         data = json.loads(payload)
         addr = data.get("addr", "").strip()
         if not addr:
@@ -26,6 +26,7 @@ import httpx
 from .api import (
     DEFAULT_CVMFS_MIRROR,
     DEFAULT_CVMFS_REPO,
+    NeurodeskContainer,
     ProgressReporter,
     _format_byte_size,
     _format_duration,
@@ -61,6 +62,7 @@ STATE_VERSION = 1
 HOST_CWD_MOUNT_ROOT = "/.hostcwd"
 SESSION_ENV_FILENAME = "env.sh"
 NEURODESKTOP_PROXY_TIMEOUT_SECONDS = 300
+ENV_KEY_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
 
 
 @dataclass(frozen=True)
@@ -1373,7 +1375,7 @@ def runtime_shell_exports(env: list[str]) -> list[str]:
         if "=" not in entry:
             continue
         key, value = entry.split("=", 1)
-        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", key):
+        if not ENV_KEY_RE.fullmatch(key):
             continue
         exports.append(f"export {key}={shlex.quote(value)}")
     return exports
@@ -1604,8 +1606,6 @@ def port_forward_from_payload(payload: dict[str, object]) -> PortForward:
 
 
 def container_handle_for_reference(client, reference: ContainerReference):
-    from .api import NeurodeskContainer
-
     return NeurodeskContainer(client, reference)
 
 
@@ -1935,7 +1935,7 @@ def write_session_env(state: SessionState) -> None:
         if "=" not in entry:
             continue
         key, value = entry.split("=", 1)
-        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", key):
+        if not ENV_KEY_RE.fullmatch(key):
             continue
         if key == "PATH":
             lines.extend(